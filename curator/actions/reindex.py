@@ -1,24 +1,37 @@
 """Reindex action class"""
 import logging
-from copy import deepcopy
+from urllib.parse import urlsplit
 # pylint: disable=broad-except
+from elasticsearch8 import ApiError, NotFoundError
 from es_client.builder import ClientArgs, OtherArgs, Builder
 from es_client.helpers.utils import ensure_list, verify_url_schema
 from es_client.exceptions import ConfigurationError
 from curator.exceptions import CuratorException, FailedExecution, NoIndices
 from curator.exceptions import ConfigurationError as CuratorConfigError # Separate from es_client
 from curator.helpers.testers import verify_index_list
-from curator.helpers.utils import report_failure
+from curator.helpers.utils import chunk_index_list, report_failure
 from curator.helpers.waiters import wait_for_it
 from curator import IndexList
 
+# Remote clients built by Reindex, keyed by connection settings, so that multiple remote reindex
+# actions against the same cluster reuse one client (and its connection pool).
+_REMOTE_CLIENT_CACHE = {}
+
 class Reindex:
     """Reindex Action Class"""
+    __slots__ = (
+        'loggit', 'body', 'index_list', 'client', 'refresh', 'requests_per_second', 'slices',
+        'timeout', 'wait_for_active_shards', 'wfc', 'wait_interval', 'max_wait', 'mpfx', 'msfx',
+        'rps_callback', 'max_concurrent_tasks', 'task_id', 'running_tasks', 'remote', 'migration',
+        'remote_host', 'remote_port', 'source_shards', '_reindex_template'
+    )
+
     def __init__(
-            self, ilo, request_body, refresh=True, requests_per_second=-1, slices=1, timeout=60,
+            self, ilo, request_body, refresh=True, requests_per_second=-1, slices='auto', timeout=60,
             wait_for_active_shards=1, wait_for_completion=True, max_wait=-1, wait_interval=9,
             remote_certificate=None, remote_client_cert=None, remote_client_key=None,
-            remote_filters=None, migration_prefix='', migration_suffix=''
+            remote_filters=None, migration_prefix='', migration_suffix='',
+            rps_callback=None, max_concurrent_tasks=1
     ):
         """
         :param ilo: An IndexList Object
@@ -30,7 +43,9 @@ class Reindex:
             ``-1`` means set no throttle as does ``unlimited`` which is the only non-float this
             accepts.
         :param slices: The number of slices this task  should be divided into. ``1`` means the task
-            will not be sliced into subtasks. (Default: ``1``)
+            will not be sliced into subtasks. ``auto`` lets Elasticsearch choose the number of
+            slices, usually one per shard. Remote reindexing does not support ``auto``, so it will
+            be set to ``1`` in that case. (Default: ``auto``)
         :param timeout: The length in seconds each individual bulk request should wait for shards
             that are unavailable. (default: ``60``)
         :param wait_for_active_shards: Sets the number of shard copies that must be active before
@@ -45,12 +60,19 @@ class Reindex:
         :param remote_client_key: Path to SSL/TLS private key
         :param migration_prefix: When migrating, prepend this value to the index name.
         :param migration_suffix: When migrating, append this value to the index name.
+        :param rps_callback: A function which is called with the ``status`` of the running reindex
+            task every ``wait_interval`` seconds while waiting for completion. If it returns a
+            number other than the current :py:attr:`requests_per_second`, the task is rethrottled
+            to that value with :py:meth:`rethrottle`.
+        :param max_concurrent_tasks: When migrating with ``wait_for_completion``, how many reindex
+            tasks may run at the same time. The number is lowered if Elasticsearch rejects a
+            reindex request with ``429 Too Many Requests``. (Default: ``1``)
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type request_body: dict
         :type refresh: bool
         :type requests_per_second: int
-        :type slices: int
+        :type slices: int or str
         :type timeout: int
         :type wait_for_active_shards: int
         :type wait_for_completion: bool
@@ -61,6 +83,8 @@ class Reindex:
         :type remote_cclient_key: str
         :type migration_prefix: str
         :type migration_suffix: str
+        :type rps_callback: callable
+        :type max_concurrent_tasks: int
         """
         if remote_filters is None:
             remote_filters = {}
@@ -68,6 +92,11 @@ class Reindex:
         verify_index_list(ilo)
         if not isinstance(request_body, dict):
             raise CuratorConfigError('"request_body" is not of type dictionary')
+        if not (isinstance(slices, int) or slices == 'auto'):
+            raise CuratorConfigError(f'"slices" must be an integer or "auto", not "{slices}"')
+        if not isinstance(max_concurrent_tasks, int) or max_concurrent_tasks < 1:
+            raise CuratorConfigError(
+                f'"max_concurrent_tasks" must be a positive integer, not "{max_concurrent_tasks}"')
         #: Object attribute that gets the value of param ``request_body``.
         self.body = request_body
         self.loggit.debug('REQUEST_BODY = %s', request_body)
@@ -97,12 +126,27 @@ class Reindex:
         self.mpfx = migration_prefix
         #: Object attribute that gets the value of param ``migration_suffix``.
         self.msfx = migration_suffix
+        #: Object attribute that gets the value of param ``rps_callback``.
+        self.rps_callback = rps_callback
+        #: Object attribute that gets the value of param ``max_concurrent_tasks``.
+        self.max_concurrent_tasks = max_concurrent_tasks
+        #: Object attribute that holds the task_id of the reindex task being waited on, or else the
+        #: most recently submitted one.
+        self.task_id = None
+        #: Object attribute that holds the task_ids of the other reindex tasks which may still be
+        #: running while :py:attr:`task_id` is waited on.
+        self.running_tasks = set()
 
         #: Object attribute that is set ``False`` unless :py:attr:`body` has
         #: ``{'source': {'remote': {}}}``, then it is set ``True``
         self.remote = False
         if 'remote' in self.body['source']:
             self.remote = True
+            if self.slices == 'auto':
+                # 'auto' is the default, so this is expected rather than worth a warning
+                self.loggit.info(
+                    'Remote reindexing does not support automatic slicing. Setting "slices" to 1')
+                self.slices = 1
 
         #: Object attribute that is set ``False`` unless :py:attr:`body` has
         #: ``{'dest': {'index': 'MIGRATION'}}``, then it is set ``True``
@@ -122,7 +166,8 @@ class Reindex:
         # provided 'ilo' (index list object).
         if self.body['source']['index'] == 'REINDEX_SELECTION' \
                 and not self.remote:
-            self.body['source']['index'] = self.index_list.indices
+            # A tuple, so later changes to the IndexList can't change what gets reindexed
+            self.body['source']['index'] = tuple(self.index_list.indices)
 
         # Remote section
         elif self.remote:
@@ -136,10 +181,14 @@ class Reindex:
             except ConfigurationError as exc:
                 raise CuratorConfigError(exc) from exc
 
-            # Now that the URL schema is verified, these will pass.
-            self.remote_host = rclient_args.hosts.split(':')[-2]
-            self.remote_host = self.remote_host.split('/')[2]
-            self.remote_port = rclient_args.hosts.split(':')[-1]
+            # Now that the URL schema is verified, it will always include a port.
+            url_parts = urlsplit(rclient_args.hosts)
+            try:
+                port = url_parts.port
+            except ValueError as exc:
+                raise CuratorConfigError(f'Invalid remote "host": {exc}') from exc
+            self.remote_host = url_parts.hostname
+            self.remote_port = str(port or (443 if url_parts.scheme == 'https' else 9200))
 
             if 'username' in self.body['source']['remote']:
                 rother_args.username = self.body['source']['remote']['username']
@@ -159,34 +208,38 @@ class Reindex:
             # The rest only applies if using filters for remote indices
             if self.body['source']['index'] == 'REINDEX_SELECTION':
                 self.loggit.debug('Filtering indices from remote')
-                msg = (
-                    f'Remote client args: '
-                    f'hosts={rclient_args.hosts} '
-                    f'username=REDACTED '
-                    f'password=REDACTED '
-                    f'certificate={remote_certificate} '
-                    f'client_cert={remote_client_cert} '
-                    f'client_key={remote_client_key} '
-                    f'request_timeout={rclient_args.remote_timeout} '
-                    f'skip_version_test=True'
+                self.loggit.debug(
+                    'Remote client args: hosts=%s username=REDACTED password=REDACTED '
+                    'certificate=%s client_cert=%s client_key=%s request_timeout=%s '
+                    'skip_version_test=True',
+                    rclient_args.hosts, remote_certificate, remote_client_cert, remote_client_key,
+                    rclient_args.remote_timeout
                 )
-                self.loggit.debug(msg)
                 remote_config = {
                     'elasticsearch': {
                         'client': rclient_args.asdict(),
                         'other_settings': rother_args.asdict()
                     }
                 }
-                try: # let's try to build a remote connection with these!
-                    builder = Builder(configdict=remote_config, version_min=(1,0,0))
-                    builder.connect()
-                    rclient = builder.client
-                except Exception as err:
-                    self.loggit.error(
-                        'Unable to establish connection to remote Elasticsearch'
-                        ' with provided credentials/certificates/settings.'
-                    )
-                    report_failure(err)
+                cache_key = (
+                    url_parts.scheme, self.remote_host, self.remote_port, rother_args.username,
+                    rother_args.password, remote_certificate, remote_client_cert, remote_client_key
+                )
+                rclient = _REMOTE_CLIENT_CACHE.get(cache_key)
+                if rclient is None:
+                    try: # let's try to build a remote connection with these!
+                        builder = Builder(configdict=remote_config, version_min=(1,0,0))
+                        builder.connect()
+                        rclient = builder.client
+                    except Exception as err:
+                        self.loggit.error(
+                            'Unable to establish connection to remote Elasticsearch'
+                            ' with provided credentials/certificates/settings.'
+                        )
+                        report_failure(err)
+                    _REMOTE_CLIENT_CACHE[cache_key] = rclient
+                else:
+                    self.loggit.debug('Reusing existing remote client connection')
                 try:
                     rio = IndexList(rclient)
                     rio.iterate_filters({'filters': remote_filters})
@@ -196,24 +249,93 @@ class Reindex:
                         raise FailedExecution(
                             'No actionable remote indices selected after applying filters.'
                         ) from exc
-                    self.body['source']['index'] = rio.indices
+                    self.body['source']['index'] = tuple(rio.indices)
                 except Exception as err:
                     self.loggit.error('Unable to get/filter list of remote indices.')
                     report_failure(err)
 
         self.loggit.debug('Reindexing indices: %s', self.body['source']['index'])
+        #: Object attribute that maps each source index to its number of primary shards, if
+        #: :py:meth:`_cap_slices` had to look them up
+        self.source_shards = {}
+        self._cap_slices()
+        self._reindex_template = self._build_reindex_template()
+
+    def _cap_slices(self):
+        """
+        Reduce a manually set :py:attr:`slices` to the number of primary shards in the source
+        indices, as more slices than shards slows the reindex down rather than speeding it up.
+        Elasticsearch slices each source index separately, so with several sources in one request
+        the smallest shard count is the limit, the same as with ``auto``. When migrating, each source index is reindexed on its own, so the largest shard count is
+        the limit here, and :py:meth:`_slices_for` lowers it further for smaller indices.
+        Elasticsearch does not support sliced reindexing from a remote cluster, so remote
+        reindexing always uses a single slice.
+        """
+        if not isinstance(self.slices, int) or self.slices <= 1:
+            return
+        if self.remote:
+            self.loggit.warning(
+                'Remote reindexing does not support slicing. Setting "slices" from %s to 1',
+                self.slices
+            )
+            self.slices = 1
+            return
+        try:
+            for chunk in chunk_index_list(self._source_list()):
+                response = self.client.indices.get_settings(
+                    index=chunk, name='index.number_of_shards')
+                for index, data in response.items():
+                    self.source_shards[index] = int(
+                        data['settings']['index']['number_of_shards'])
+        except Exception as exc:
+            self.loggit.debug('Unable to get shard count of source indices: %s', exc)
+            self.source_shards = {}
+            return
+        if not self.source_shards:
+            return
+        if self.migration:
+            max_shards = max(self.source_shards.values())
+        else:
+            max_shards = min(self.source_shards.values())
+        if 0 < max_shards < self.slices:
+            self.loggit.warning(
+                'Reducing "slices" from %s to %s to match the number of source shards',
+                self.slices, max_shards
+            )
+            self.slices = max_shards
+
+    def _slices_for(self, source):
+        """
+        :param source: The source index or indices
+        :type source: str or tuple
+
+        :returns: :py:attr:`slices`, or the number of primary shards in ``source`` if that is
+            lower and ``source`` is a single index being migrated.
+        """
+        shards = self.source_shards.get(source) if self.migration else None
+        if shards and isinstance(self.slices, int) and shards < self.slices:
+            return shards
+        return self.slices
 
     def _get_request_body(self, source, dest):
-        body = deepcopy(self.body)
+        # Only source.index and dest.index change, so a two-level shallow copy is all we need
+        body = dict(self.body)
+        body['source'] = dict(self.body['source'])
+        body['dest'] = dict(self.body['dest'])
         body['source']['index'] = source
         body['dest']['index'] = dest
         return body
 
-    def _get_reindex_args(self, source, dest):
+    def _build_reindex_template(self):
+        """
+        Build the arguments for :py:meth:`~.elasticsearch.Elasticsearch.reindex` which are the
+        same for every source and dest, so :py:meth:`_get_reindex_args` only has to fill in the
+        index names.
+        """
         # Always set wait_for_completion to False. Let 'wait_for_it' do its
         # thing if wait_for_completion is set to True. Report the task_id
         # either way.
-        reindex_args = {
+        template = {
             'refresh':self.refresh,
             'requests_per_second': self.requests_per_second,
             'slices': self.slices,
@@ -223,19 +345,84 @@ class Reindex:
         }
         for keyname in ['dest', 'source', 'conflicts', 'max_docs', 'size', '_source', 'script']:
             if keyname in self.body:
-                reindex_args[keyname] = self.body[keyname]
-        # Mimic the _get_request_body(source, dest) behavior by casting these values here instead
+                template[keyname] = self.body[keyname]
+        return template
+
+    def _get_reindex_args(self, source, dest):
+        reindex_args = dict(self._reindex_template)
+        # Mimic the _get_request_body(source, dest) behavior by copying these before casting the
+        # values here, so that self.body is left untouched
+        reindex_args['dest'] = dict(reindex_args['dest'])
+        reindex_args['source'] = dict(reindex_args['source'])
         reindex_args['dest']['index'] = dest
         reindex_args['source']['index'] = source
+        reindex_args['slices'] = self._slices_for(source)
         return reindex_args
 
-    def get_processed_items(self, task_id):
+    def rethrottle(self, requests_per_second):
+        """
+        Change the throttle of the running reindex task identified by :py:attr:`task_id`, and of
+        any other tasks in :py:attr:`running_tasks`, with
+        :py:meth:`~.elasticsearch.Elasticsearch.reindex_rethrottle`, and update
+        :py:attr:`requests_per_second` to match. Tasks in :py:attr:`running_tasks` which have
+        already finished are dropped from it.
+
+        :param requests_per_second: The new throttle in sub-requests per second. ``-1`` means no
+            throttle.
+        :type requests_per_second: float
+        """
+        if self.task_id is None:
+            raise CuratorException('No running reindex task to rethrottle')
+        task_ids = [self.task_id]
+        task_ids.extend(task_id for task_id in self.running_tasks if task_id != self.task_id)
+        for task_id in task_ids:
+            self.loggit.info(
+                'Rethrottling task_id "%s" from %s to %s requests per second',
+                task_id, self.requests_per_second, requests_per_second
+            )
+            try:
+                self.client.reindex_rethrottle(
+                    task_id=task_id, requests_per_second=requests_per_second)
+            except NotFoundError as exc:
+                if task_id == self.task_id:
+                    raise CuratorException(
+                        f'Unable to rethrottle task_id "{task_id}". Exception {exc}') from exc
+                # Nobody is waiting on this task yet, so it may well have finished already
+                self.loggit.debug('Task_id "%s" is no longer running: %s', task_id, exc)
+                self.running_tasks.discard(task_id)
+            except Exception as exc:
+                raise CuratorException(
+                    f'Unable to rethrottle task_id "{task_id}". Exception {exc}') from exc
+        self.requests_per_second = requests_per_second
+        self._reindex_template['requests_per_second'] = requests_per_second
+
+    def _throttle_check(self, task_data):
+        """Pass the task status to :py:attr:`rps_callback` and rethrottle if it asks for it"""
+        new_rps = self.rps_callback(task_data['task'].get('status', {}))
+        if new_rps is not None and new_rps != self.requests_per_second:
+            try:
+                self.rethrottle(new_rps)
+            except CuratorException as exc:
+                # The task may have completed since it was checked. Either way, a throttle
+                # adjustment must not fail the reindex itself.
+                self.loggit.warning('Unable to rethrottle reindex: %s', exc)
+
+    def get_task_result(self, task_id):
         """
         This function calls :py:func:`~.elasticsearch.client.TasksClient.get` with the provided
-        ``task_id``.  It will get the value from ``'response.total'`` as the total number of
-        elements processed during reindexing. If the value is not found, it will return ``-1``
+        ``task_id``, and returns what the reindex task reported:
+
+        * The value of ``'response.total'`` as the total number of elements processed during
+          reindexing, or ``-1`` if it is not found.
+        * The sum of ``'response.created'`` and ``'response.updated'`` as the number of documents
+          written to the dest, or ``-1`` if there is no ``response``. Unlike ``total``, this does
+          not count noops, which write nothing.
+        * The list in ``'response.failures'``, or ``None`` if there is no ``response``.
+        * The value of ``'error'``, or ``None`` if the task reported no error.
 
         :param task_id: A task_id which ostensibly matches a task searchable in the tasks API.
+
+        :rtype: tuple
         """
         try:
             task_data = self.client.tasks.get(task_id=task_id)
@@ -244,6 +431,8 @@ class Reindex:
                 f'Unable to obtain task information for task_id "{task_id}". Exception {exc}'
             ) from exc
         total_processed_items = -1
+        written_items = -1
+        failures = None
         task = task_data['task']
         if task['action'] == 'indices:data/write/reindex':
             self.loggit.debug("It's a REINDEX TASK'")
@@ -252,55 +441,107 @@ class Reindex:
             if 'response' in task_data:
                 response = task_data['response']
                 total_processed_items = response['total']
-                self.loggit.debug('total_processed_items = %s', total_processed_items)
-        return total_processed_items
+                written_items = response.get('created', 0) + response.get('updated', 0)
+                failures = response.get('failures', [])
+                self.loggit.debug(
+                    'total_processed_items = %s, written_items = %s',
+                    total_processed_items, written_items
+                )
+        return total_processed_items, written_items, failures, task_data.get('error')
+
+    def get_processed_items(self, task_id):
+        """
+        This function calls :py:meth:`get_task_result` with the provided ``task_id`` and returns
+        only the total number of elements processed during reindexing, or ``-1`` if the value is
+        not found.
+
+        :param task_id: A task_id which ostensibly matches a task searchable in the tasks API.
+
+        :rtype: int
+        """
+        return self.get_task_result(task_id)[0]
+
+    def _dest_exists(self, index_name):
+        """
+        Check whether ``index_name`` resolves to an index, alias, or data stream with a single call
+        to :py:meth:`~.elasticsearch.client.IndicesClient.resolve_index`. If that API is not
+        available, check for an index or an alias instead.
+
+        :param index_name: The name of the reindex ``dest``
+        :type index_name: str
+
+        :rtype: bool
+        """
+        try:
+            resolved = self.client.indices.resolve_index(name=index_name)
+        except NotFoundError:
+            return False
+        except ApiError as exc:
+            self.loggit.debug('Unable to resolve index "%s": %s', index_name, exc)
+            return bool(
+                self.client.indices.exists(index=index_name)
+                or self.client.indices.exists_alias(name=index_name)
+            )
+        return any(resolved.get(kind) for kind in ('indices', 'aliases', 'data_streams'))
 
     def _post_run_quick_check(self, index_name, task_id):
         # Check whether any documents were processed
         # if no documents processed, the target index "dest" won't exist
-        processed_items = self.get_processed_items(task_id)
+        processed_items, written_items, failures, error = self.get_task_result(task_id)
         if processed_items == 0:
-            msg = f'No items were processed. Will not check if target index "{index_name}" exists'
-            self.loggit.info(msg)
+            self.loggit.info(
+                'No items were processed. Will not check if target index "%s" exists', index_name)
+        elif written_items > 0 and failures == [] and error is None:
+            # The task reports documents written without failures, so the dest must exist
+            self.loggit.debug(
+                'Reindex task reported %s items written without failures. Will not check if '
+                'target index "%s" exists', written_items, index_name
+            )
         else:
             # Verify the destination index is there after the fact
-            index_exists = self.client.indices.exists(index=index_name)
-            alias_instead = self.client.indices.exists_alias(name=index_name)
-            if not index_exists and not alias_instead:
-                # pylint: disable=logging-fstring-interpolation
+            if not self._dest_exists(index_name):
                 self.loggit.error(
-                    f'The index described as "{index_name}" was not found after the reindex '
-                    f'operation. Check Elasticsearch logs for more '
-                    f'information.'
+                    'The index described as "%s" was not found after the reindex operation. '
+                    'Check Elasticsearch logs for more information.', index_name
                 )
                 if self.remote:
-                    # pylint: disable=logging-fstring-interpolation
                     self.loggit.error(
-                        f'Did you forget to add "reindex.remote.whitelist: '
-                        f'{self.remote_host}:{self.remote_port}" to the elasticsearch.yml file on '
-                        f'the "dest" node?'
+                        'Did you forget to add "reindex.remote.whitelist: %s:%s" to the '
+                        'elasticsearch.yml file on the "dest" node?',
+                        self.remote_host, self.remote_port
                     )
                 raise FailedExecution(
                     f'Reindex failed. The index or alias identified by "{index_name}" was '
                     f'not found.'
                 )
 
+    def _source_list(self):
+        """
+        :returns: The source index or indices from :py:attr:`body` as a tuple, which is how
+            ``REINDEX_SELECTION`` is stored.
+        :rtype: tuple
+        """
+        sources = self.body['source']['index']
+        return sources if isinstance(sources, tuple) else tuple(ensure_list(sources))
+
     def sources(self):
         """Generator for Reindexing ``sources`` & ``dests``"""
         dest = self.body['dest']['index']
-        source_list = ensure_list(self.body['source']['index'])
-        self.loggit.debug('source_list: %s', source_list)
-        if not source_list or source_list == ['REINDEX_SELECTED']: # Empty list
-            raise NoIndices
+        sources = self.body['source']['index']
+        self.loggit.debug('sources: %s', sources)
         if not self.migration:
-            yield self.body['source']['index'], dest
+            # All sources go to the one dest, so there is no need to make a list of them
+            if not sources or sources in ('REINDEX_SELECTED', ['REINDEX_SELECTED']): # Empty list
+                raise NoIndices
+            yield sources, dest
+            return
 
-        # Loop over all sources (default will only be one)
-        else:
-            for source in source_list:
-                if self.migration:
-                    dest = self.mpfx + source + self.msfx
-                yield source, dest
+        # Loop over all sources, each of which gets its own dest
+        source_list = self._source_list()
+        if not source_list or source_list == ('REINDEX_SELECTED',): # Empty list
+            raise NoIndices
+        for source in source_list:
+            yield source, f'{self.mpfx}{source}{self.msfx}'
 
     def show_run_args(self, source, dest):
         """Show what will run"""
@@ -308,7 +549,7 @@ class Reindex:
             f'request body: {self._get_request_body(source, dest)} with arguments: '
             f'refresh={self.refresh} '
             f'requests_per_second={self.requests_per_second} '
-            f'slices={self.slices} '
+            f'slices={self._slices_for(source)} '
             f'timeout={self.timeout} '
             f'wait_for_active_shards={self.wait_for_active_shards} '
             f'wait_for_completion={self.wfc}'
@@ -320,6 +561,64 @@ class Reindex:
         for source, dest in self.sources():
             self.loggit.info('DRY-RUN: REINDEX: %s', self.show_run_args(source, dest))
 
+    def _submit(self, source, dest, pending):
+        """
+        Start a reindex task from ``source`` to ``dest``. If Elasticsearch rejects it with
+        ``429 Too Many Requests`` while other tasks are ``pending``, wait for the oldest of those to
+        finish, lower :py:attr:`max_concurrent_tasks` to match, and try again.
+
+        :param source: The source index or indices
+        :param dest: The dest index
+        :param pending: The task_id: dest of tasks still to be waited on
+
+        :type source: str or list
+        :type dest: str
+        :type pending: dict
+
+        :returns: The task_id of the new reindex task
+        :rtype: str
+        """
+        self.loggit.info('Commencing reindex operation')
+        if self.loggit.isEnabledFor(logging.DEBUG):
+            # Skip building the run args string when it will not be logged
+            self.loggit.debug('REINDEX: %s', self.show_run_args(source, dest))
+        while True:
+            try:
+                response = self.client.reindex(**self._get_reindex_args(source, dest))
+                break
+            except ApiError as exc:
+                if exc.status_code != 429 or not pending:
+                    raise
+                self.max_concurrent_tasks = len(pending)
+                self.loggit.warning(
+                    'Reindex request rejected with 429 Too Many Requests. Lowering '
+                    'max_concurrent_tasks to %s', self.max_concurrent_tasks
+                )
+                self._wait_for_oldest(pending)
+        self.task_id = response['task']
+        self.loggit.debug('TASK ID = %s', self.task_id)
+        return self.task_id
+
+    def _wait_for_oldest(self, pending):
+        """
+        Wait for the oldest of the ``pending`` reindex tasks to complete, check its dest, and remove
+        it from ``pending``.
+
+        :param pending: The task_id: dest of tasks still to be waited on
+        :type pending: dict
+        """
+        task_id = next(iter(pending))
+        dest = pending.pop(task_id)
+        self.running_tasks.discard(task_id)
+        # Point rethrottle() at the task being waited on
+        self.task_id = task_id
+        wait_for_it(
+            self.client, 'reindex', task_id=task_id,
+            wait_interval=self.wait_interval, max_wait=self.max_wait,
+            task_callback=self._throttle_check if self.rps_callback else None
+        )
+        self._post_run_quick_check(dest, task_id)
+
     def do_action(self):
         """
         Execute :py:meth:`~.elasticsearch.Elasticsearch.reindex` operation with the
@@ -328,26 +627,25 @@ class Reindex:
         :py:attr:`wait_for_active_shards`, and :py:attr:`wfc`.
         """
         try:
+            # task_id: dest of reindex tasks that are still to be waited on, oldest first
+            pending = {}
+            self.running_tasks = set()
             # Loop over all sources (default will only be one)
             for source, dest in self.sources():
-                self.loggit.info('Commencing reindex operation')
-                self.loggit.debug('REINDEX: %s', self.show_run_args(source, dest))
-                response = self.client.reindex(**self._get_reindex_args(source, dest))
-
-                self.loggit.debug('TASK ID = %s', response['task'])
+                while len(pending) >= self.max_concurrent_tasks:
+                    self._wait_for_oldest(pending)
+                task_id = self._submit(source, dest, pending)
                 if self.wfc:
-                    wait_for_it(
-                        self.client, 'reindex', task_id=response['task'],
-                        wait_interval=self.wait_interval, max_wait=self.max_wait
-                    )
-                    self._post_run_quick_check(dest, response['task'])
-
+                    pending[task_id] = dest
+                    # Let rethrottle() reach this task while another one is waited on
+                    self.running_tasks.add(task_id)
                 else:
-                    msg = (
-                        f'"wait_for_completion" set to {self.wfc}.  Remember to check task_id '
-                        f"\"{response['task']}\" for successful completion manually."
+                    self.loggit.warning(
+                        '"wait_for_completion" set to %s.  Remember to check task_id "%s" for '
+                        'successful completion manually.', self.wfc, task_id
                     )
-                    self.loggit.warning(msg)
+            while pending:
+                self._wait_for_oldest(pending)
         except NoIndices as exc:
             raise NoIndices(
                 'Source index must be list of actual indices. It must not be an empty list.'
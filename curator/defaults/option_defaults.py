@@ -145,6 +145,12 @@ def key():
     """
     return {Required('key'): Any(*string_types)}
 
+def max_concurrent_tasks():
+    """
+    :returns: ``{Optional('max_concurrent_tasks', default=1): All(Coerce(int), Range(min=1, max=100))}``
+    """
+    return {Optional('max_concurrent_tasks', default=1): All(Coerce(int), Range(min=1, max=100))}
+
 def max_num_segments():
     """
     :returns: ``{Required('max_num_segments'): All(Coerce(int), Range(min=1, max=32768))}``
@@ -404,11 +410,14 @@ def skip_repo_fs_check():
     """
     return {Optional('skip_repo_fs_check', default=True): Any(bool, All(Any(*string_types), Boolean()))}
 
+# The slices validator does not depend on the action, so it is only built once
+SLICES = Any('auto', All(Coerce(int), Range(min=1, max=500)), None)
+
 def slices():
     """
-    :returns: ``{Optional('slices', default=1): Any(All(Coerce(int), Range(min=1, max=500)), None)}``
+    :returns: ``{Optional('slices', default='auto'): Any('auto', All(Coerce(int), Range(min=1, max=500)), None)}``
     """
-    return {Optional('slices', default=1): Any(All(Coerce(int), Range(min=1, max=500)), None)}
+    return {Optional('slices', default='auto'): SLICES}
 
 def timeout(action):
     """
@@ -198,6 +198,8 @@ def validate_actions(data):
         current_action = valid_structure['action']
         # And let's update the location with the action.
         loc = f'Action ID "{action_id}", action "{current_action}"'
+        # Build the filter Schema once per action, as it is reused for every filter block below
+        filter_schema = Schema(validfilters(current_action, location=loc))
         clean_options = SchemaCheck(
             prune_nones(valid_structure['options']),
             options.get_schema(current_action),
@@ -215,7 +217,7 @@ def validate_actions(data):
                 if k in valid_structure:
                     current_filters = SchemaCheck(
                         valid_structure[k]['filters'],
-                        Schema(validfilters(current_action, location=loc)),
+                        filter_schema,
                         f'"{k}" filters',
                         f'{loc}, "filters"'
                     ).result()
@@ -224,7 +226,7 @@ def validate_actions(data):
                             k: {
                                 'filters' : SchemaCheck(
                                     current_filters,
-                                    Schema(validfilters(current_action, location=loc)),
+                                    filter_schema,
                                     'filters',
                                     f'{loc}, "{k}", "filters"'
                                     ).result()
@@ -239,7 +241,7 @@ def validate_actions(data):
         else: # Filters key only appears in non-alias actions
             valid_filters = SchemaCheck(
                 valid_structure['filters'],
-                Schema(validfilters(current_action, location=loc)),
+                filter_schema,
                 'filters',
                 f'{loc}, "filters"'
             ).result()
@@ -251,7 +253,7 @@ def validate_actions(data):
             if 'remote_filters' in valid_structure['options']:
                 valid_filters = SchemaCheck(
                     valid_structure['options']['remote_filters'],
-                    Schema(validfilters(current_action, location=loc)),
+                    filter_schema,
                     'filters',
                     f'{loc}, "filters"'
                 ).result()
@@ -5,10 +5,15 @@
 import logging
 from time import localtime, sleep, strftime
 from datetime import datetime
+from elasticsearch8 import exceptions as es8exc
 from curator.exceptions import (
     ActionTimeout, ConfigurationError, CuratorException, FailedReindex, MissingArgument)
 from curator.helpers.utils import chunk_index_list
 
+# Seconds added to the client request_timeout of a wait_for_completion request, on top of the time
+# Elasticsearch is asked to wait
+WAIT_MARGIN = 30
+
 def health_check(client, **kwargs):
     """
     This function calls `client.cluster.` :py:meth:`~.elasticsearch.client.ClusterClient.health` and, based on the
@@ -163,25 +168,71 @@ def snapshot_check(client, snapshot=None, repository=None):
         logger.warning('Snapshot %s completed with state: %s', snapshot, state)
     return retval
 
-def task_check(client, task_id=None):
+def server_timed_out(err):
+    """
+    :param err: An exception raised by an Elasticsearch API call
+    :type err: :py:exc:`Exception`
+
+    :returns: ``True`` if ``err`` is Elasticsearch reporting that it stopped waiting, as it does for
+        a ``wait_for_completion`` request whose ``timeout`` passed before the task completed.
+    :rtype: bool
+    """
+    return isinstance(err, es8exc.ApiError) and (
+        err.status_code == 408 or 'timeout_exception' in str(err))
+
+def task_check(client, task_id=None, wait_timeout=None, callback=None):
     """
     This function calls `client.tasks.` :py:meth:`~.elasticsearch.client.TasksClient.get` with the
     provided ``task_id``.  If the task data contains ``'completed': True``, then it will return
     ``True``. If the task is not completed, it will log some information about the task and return
     ``False``
 
+    If ``wait_timeout`` is set, Elasticsearch is asked to hold the request until the task completes,
+    or until ``wait_timeout`` seconds have passed, whichever comes first. If the timeout is reached,
+    ``False`` is returned.
+
+    If ``callback`` is set, it is called with the task data every time the task is found to be
+    not yet completed. When ``wait_timeout`` is reached, the task data for ``callback`` comes from
+    an extra :py:meth:`~.elasticsearch.client.TasksClient.get` call without waiting.
+
     :param client: A client connection object
     :param task_id: The task id
+    :param wait_timeout: Seconds for Elasticsearch to wait for the task to complete
+    :param callback: A function which accepts the task data as its only argument
 
     :type client: :py:class:`~.elasticsearch.Elasticsearch`
     :type task_id: str
+    :type wait_timeout: int
+    :type callback: callable
 
     :rtype: bool
     """
     logger = logging.getLogger(__name__)
     try:
-        task_data = client.tasks.get(task_id=task_id)
+        if wait_timeout:
+            # The client must not give up before Elasticsearch is done waiting
+            task_data = client.options(request_timeout=wait_timeout + WAIT_MARGIN).tasks.get(
+                task_id=task_id, wait_for_completion=True, timeout=f'{wait_timeout}s')
+        else:
+            task_data = client.tasks.get(task_id=task_id)
     except Exception as err:
+        if wait_timeout and server_timed_out(err):
+            logger.info(
+                'Task with task_id "%s" not completed after waiting %s seconds',
+                task_id, wait_timeout
+            )
+            if callback is not None:
+                # The timed out request has no task data, so get the current status
+                try:
+                    task_data = client.tasks.get(task_id=task_id)
+                except Exception as exc:
+                    msg = (
+                        f'Unable to obtain task information for task_id "{task_id}". '
+                        f'Exception {exc}'
+                    )
+                    raise CuratorException(msg) from exc
+                callback(task_data)
+            return False
         msg = f'Unable to obtain task information for task_id "{task_id}". Exception {err}'
         raise CuratorException(msg) from err
     task = task_data['task']
@@ -211,13 +262,15 @@ def task_check(client, task_id=None):
             f'Task "{descr}" with task_id "{task_id}" has been running for {running_time} seconds'
         )
         logger.info(msg)
+        if callback is not None:
+            callback(task_data)
         retval = False
     return retval
 
 # pylint: disable=too-many-locals, too-many-arguments
 def wait_for_it(
         client, action, task_id=None, snapshot=None, repository=None, index=None, index_list=None,
-        wait_interval=9, max_wait=-1
+        wait_interval=9, max_wait=-1, task_callback=None
     ):
     """
     This function becomes one place to do all ``wait_for_completion`` type behaviors
@@ -229,6 +282,7 @@ def wait_for_it(
     :param repository: The Elasticsearch snapshot repository to use
     :param wait_interval: Seconds to wait between completion checks.
     :param max_wait: Maximum number of seconds to ``wait_for_completion``
+    :param task_callback: Passed to :py:func:`task_check` as ``callback`` for ``reindex``
 
     :type client: :py:class:`~.elasticsearch.Elasticsearch`
     :type action: str
@@ -237,6 +291,7 @@ def wait_for_it(
     :type repository: str
     :type wait_interval: int
     :type max_wait: int
+    :type task_callback: callable
     :rtype: None
     """
     logger = logging.getLogger(__name__)
@@ -247,7 +302,10 @@ def wait_for_it(
         'snapshot':{
             'function':snapshot_check, 'args':{'snapshot':snapshot, 'repository':repository}},
         'restore':{'function':restore_check, 'args':{'index_list':index_list}},
-        'reindex':{'function':task_check, 'args':{'task_id':task_id}},
+        'reindex':{
+            'function':task_check,
+            'args':{'task_id':task_id, 'wait_timeout':wait_interval, 'callback':task_callback}
+        },
         'shrink':{'function': health_check, 'args': {'status':'green'}},
         'relocate':{'function': relocate_check, 'args': {'index':index}},
     }
@@ -278,6 +336,7 @@ def wait_for_it(
     while True:
         elapsed = int((datetime.now() - start_time).total_seconds())
         logger.debug('Elapsed time: %s seconds', elapsed)
+        check_start = datetime.now()
         response = action_map[action]['function'](client, **action_map[action]['args'])
         logger.debug('Response: %s', response)
         # Success
@@ -292,12 +351,17 @@ def wait_for_it(
             logger.error(msg)
             break
         # Not success, so we wait.
+        pause = wait_interval
+        if action == 'reindex':
+            # Elasticsearch already held the task_check request for up to wait_interval seconds,
+            # so only sleep for whatever is left of that interval.
+            pause = max(0, wait_interval - (datetime.now() - check_start).total_seconds())
         msg = (
             f'Action "{action}" not yet complete, {elapsed} total seconds elapsed. '
-            f'Waiting {wait_interval} seconds before checking again.'
+            f'Waiting {pause} seconds before checking again.'
         )
         logger.debug(msg)
-        sleep(wait_interval)
+        sleep(pause)
 
     logger.debug('Result: %s', result)
     if not result:
@@ -25,6 +25,10 @@ def valid_action():
         )
     }
 
+#: The :py:class:`~.voluptuous.schema_builder.Schema` used by :py:func:`structure` to check the
+#: action type. It does not change, so it is only built once.
+ACTION_TYPE = Schema(valid_action(), extra=True)
+
 def structure(data, location):
     """
     Return a valid :py:class:`~.voluptuous.schema_builder.Schema` definition which tests ``data``,
@@ -42,7 +46,7 @@ def structure(data, location):
     """
     _ = SchemaCheck(
         data,
-        Schema(valid_action(), extra=True),
+        ACTION_TYPE,
         'action type',
         location,
     ).result()
@@ -83,6 +83,7 @@ def action_specific(action):
             option_defaults.remote_filters(),
             option_defaults.migration_prefix(),
             option_defaults.migration_suffix(),
+            option_defaults.max_concurrent_tasks(),
         ],
         'replicas' : [
             option_defaults.count(),
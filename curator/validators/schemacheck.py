@@ -1,9 +1,14 @@
 """Schema checker"""
 import logging
-import re
 from curator.exceptions import ConfigurationError
 
+logger = logging.getLogger('curator.validators.SchemaCheck')
+# Translation table used to strip single quotes and closing brackets from error paths
+STRIP_TABLE = str.maketrans('', '', "']")
+
 class SchemaCheck(object):
+    __slots__ = ('loggit', 'config', 'schema', 'test_what', 'location', 'badvalue', 'error')
+
     def __init__(self, config, schema, test_what, location):
         """
         Validate ``config`` with the provided :py:class:`~.voluptuous.schema_builder.Schema` from
@@ -20,7 +25,7 @@ class SchemaCheck(object):
         :param location: A string to report which configuration sub-block is being tested.
         :type location: str
         """
-        self.loggit = logging.getLogger('curator.validators.SchemaCheck')
+        self.loggit = logger
         # Set the Schema for validation...
         self.loggit.debug('Schema: %s', schema)
         self.loggit.debug('"%s" config: %s', test_what, config)
@@ -42,7 +47,7 @@ class SchemaCheck(object):
         Report the error, and try to report the bad key or value as well.
         """
         def get_badvalue(data_string, data):
-            elements = re.sub(r'[\'\]]', '', data_string).split('[')
+            elements = data_string.translate(STRIP_TABLE).split('[')
             elements.pop(0) # Get rid of data as the first element
             value = None
             for k in elements:
@@ -55,7 +60,7 @@ class SchemaCheck(object):
                     # if this fails, it's caught below
             return value
         try:
-            self.badvalue = get_badvalue(str(self.error).split()[-1], self.config)
+            self.badvalue = get_badvalue(str(self.error).rsplit(maxsplit=1)[-1], self.config)
         except Exception:
             self.badvalue = '(could not determine)'
 
@@ -1,12 +1,31 @@
 """test_action_reindex"""
 from unittest import TestCase
-from mock import Mock
+from mock import Mock, call, patch
+from elasticsearch8 import ApiError, NotFoundError
 from curator.actions import Reindex
+from curator.actions.reindex import _REMOTE_CLIENT_CACHE
 from curator.exceptions import ConfigurationError, CuratorException, FailedExecution, NoIndices
 from curator import IndexList
 # Get test variables and constants from a single source
 from . import testvars
 
+def fake_tasks_get(timeouts=1):
+    """
+    Mimic the tasks API: the first ``timeouts`` wait_for_completion calls time out, later ones
+    complete the task, and a plain call returns the task as it currently is
+    """
+    waits = [ApiError('timeout_exception', Mock(status=408), {}) for _ in range(timeouts)]
+    completed = set()
+    def tasks_get(task_id=None, wait_for_completion=False, timeout=None):
+        if wait_for_completion:
+            if waits:
+                raise waits.pop()
+            completed.add(task_id)
+        if task_id in completed:
+            return testvars.completed_task
+        return testvars.incomplete_task
+    return tasks_get
+
 class TestActionReindex(TestCase):
     def test_init_bad_ilo(self):
         self.assertRaises(TypeError, Reindex, 'foo', 'invalid')
@@ -55,7 +74,7 @@ class TestActionReindex(TestCase):
         client.indices.stats.return_value = testvars.stats_four
         ilo = IndexList(client)
         ro = Reindex(ilo, testvars.reindex_replace)
-        self.assertEqual(ro.index_list.indices, ro.body['source']['index'])
+        self.assertEqual(tuple(ro.index_list.indices), ro.body['source']['index'])
     def test_reindex_with_wait(self):
         client = Mock()
         client.info.return_value = {'version': {'number': '5.0.0'} }
@@ -63,6 +82,7 @@ class TestActionReindex(TestCase):
         client.cluster.state.return_value = testvars.clu_state_four
         client.indices.stats.return_value = testvars.stats_four
         client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
         client.tasks.get.return_value = testvars.completed_task
         ilo = IndexList(client)
         # After building ilo, we need a different return value
@@ -76,6 +96,7 @@ class TestActionReindex(TestCase):
         client.cluster.state.return_value = testvars.clu_state_four
         client.indices.stats.return_value = testvars.stats_four
         client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
         client.tasks.get.return_value = testvars.completed_task_zero_total
         ilo = IndexList(client)
         # After building ilo, we need a different return value
@@ -89,6 +110,7 @@ class TestActionReindex(TestCase):
         client.cluster.state.return_value = testvars.clu_state_four
         client.indices.stats.return_value = testvars.stats_four
         client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
         client.tasks.get.side_effect = testvars.fake_fail
         ilo = IndexList(client)
         # After building ilo, we need a different return value
@@ -102,6 +124,7 @@ class TestActionReindex(TestCase):
         client.cluster.state.return_value = testvars.clu_state_four
         client.indices.stats.return_value = testvars.stats_four
         client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
         client.tasks.get.return_value = testvars.completed_task
         ilo = IndexList(client)
         ro = Reindex(ilo, testvars.reindex_basic,
@@ -114,6 +137,7 @@ class TestActionReindex(TestCase):
         client.cluster.state.return_value = testvars.clu_state_four
         client.indices.stats.return_value = testvars.stats_four
         client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
         client.tasks.get.return_value = testvars.incomplete_task
         ilo = IndexList(client)
         ro = Reindex(ilo, testvars.reindex_basic,
@@ -126,6 +150,7 @@ class TestActionReindex(TestCase):
         client.cluster.state.return_value = testvars.clu_state_four
         client.indices.stats.return_value = testvars.stats_four
         client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
         client.tasks.get.return_value = testvars.completed_task
         ilo = IndexList(client)
         # After building ilo, we need a different return value
@@ -146,6 +171,7 @@ class TestActionReindex(TestCase):
         client.cluster.state.return_value = testvars.clu_state_four
         client.indices.stats.return_value = testvars.stats_four
         client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
         client.tasks.get.return_value = testvars.completed_task
         ilo = IndexList(client)
         # After building ilo, we need a different return value
@@ -166,6 +192,7 @@ class TestActionReindex(TestCase):
         client.cluster.state.return_value = testvars.clu_state_four
         client.indices.stats.return_value = testvars.stats_four
         client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
         client.tasks.get.return_value = testvars.completed_task
         ilo = IndexList(client)
         # After building ilo, we need a different return value
@@ -186,6 +213,7 @@ class TestActionReindex(TestCase):
         client.cluster.state.return_value = testvars.clu_state_four
         client.indices.stats.return_value = testvars.stats_four
         client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
         client.tasks.get.return_value = testvars.completed_task
         ilo = IndexList(client)
         # After building ilo, we need a different return value
@@ -213,3 +241,376 @@ class TestActionReindex(TestCase):
         }
         ro = Reindex(ilo, badval)
         self.assertRaises(NoIndices, ro.do_action)
+    def test_init_raise_bad_slices(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_one
+        client.cluster.state.return_value = testvars.clu_state_one
+        client.indices.stats.return_value = testvars.stats_one
+        ilo = IndexList(client)
+        self.assertRaises(ConfigurationError,
+            Reindex, ilo, testvars.reindex_basic, slices='invalid')
+    def test_init_raise_bad_max_concurrent_tasks(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_one
+        client.cluster.state.return_value = testvars.clu_state_one
+        client.indices.stats.return_value = testvars.stats_one
+        ilo = IndexList(client)
+        for badval in [0, -1, '2']:
+            self.assertRaises(ConfigurationError,
+                Reindex, ilo, testvars.reindex_basic, max_concurrent_tasks=badval)
+    def test_auto_slices(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_one
+        client.cluster.state.return_value = testvars.clu_state_one
+        client.indices.stats.return_value = testvars.stats_one
+        ilo = IndexList(client)
+        ro = Reindex(ilo, testvars.reindex_basic)
+        self.assertEqual('auto', ro._get_reindex_args(testvars.named_index, 'other_index')['slices'])
+    def test_remote_auto_slices(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_one
+        client.cluster.state.return_value = testvars.clu_state_one
+        client.indices.stats.return_value = testvars.stats_one
+        ilo = IndexList(client)
+        body = {
+            'source': {
+                'index': 'irrelevant',
+                'remote': {'host': 'https://example.org:9200'}
+            },
+            'dest': { 'index': 'other_index' }
+        }
+        ro = Reindex(ilo, body, slices='auto')
+        self.assertEqual(1, ro.slices)
+    def test_cap_slices_to_shards(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_one
+        client.cluster.state.return_value = testvars.clu_state_one
+        client.indices.stats.return_value = testvars.stats_one
+        ilo = IndexList(client)
+        client.indices.get_settings.return_value = {
+            testvars.named_index: {'settings': {'index': {'number_of_shards': '2'}}}
+        }
+        ro = Reindex(ilo, testvars.reindex_basic, slices=10)
+        self.assertEqual(2, ro.slices)
+    def test_cap_slices_to_smallest_source(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        ilo = IndexList(client)
+        first, second = sorted(ilo.indices)
+        client.indices.get_settings.return_value = {
+            first: {'settings': {'index': {'number_of_shards': '1'}}},
+            second: {'settings': {'index': {'number_of_shards': '3'}}},
+        }
+        body = {'source': {'index': 'REINDEX_SELECTION'}, 'dest': {'index': 'other_index'}}
+        ro = Reindex(ilo, body, slices=2)
+        self.assertEqual(1, ro.slices)
+    def test_remote_explicit_slices(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_one
+        client.cluster.state.return_value = testvars.clu_state_one
+        client.indices.stats.return_value = testvars.stats_one
+        ilo = IndexList(client)
+        body = {
+            'source': {
+                'index': 'irrelevant',
+                'remote': {'host': 'https://example.org:9200'}
+            },
+            'dest': { 'index': 'other_index' }
+        }
+        ro = Reindex(ilo, body, slices=10)
+        self.assertEqual(1, ro.slices)
+    def test_get_reindex_args_leaves_body_untouched(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_one
+        client.cluster.state.return_value = testvars.clu_state_one
+        client.indices.stats.return_value = testvars.stats_one
+        ilo = IndexList(client)
+        body = {'source': {'index': testvars.named_index}, 'dest': {'index': 'MIGRATION'}}
+        ro = Reindex(ilo, body, migration_prefix='new-')
+        args = ro._get_reindex_args(testvars.named_index, 'new-index_name')
+        self.assertEqual('new-index_name', args['dest']['index'])
+        self.assertEqual('MIGRATION', ro.body['dest']['index'])
+    def test_rethrottle_without_task(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_one
+        client.cluster.state.return_value = testvars.clu_state_one
+        client.indices.stats.return_value = testvars.stats_one
+        ilo = IndexList(client)
+        ro = Reindex(ilo, testvars.reindex_basic)
+        self.assertRaises(CuratorException, ro.rethrottle, 500)
+    def test_reindex_with_rps_callback(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
+        client.tasks.get.side_effect = fake_tasks_get()
+        ilo = IndexList(client)
+        ro = Reindex(ilo, testvars.reindex_basic, wait_interval=1, rps_callback=lambda x: 500)
+        self.assertIsNone(ro.do_action())
+        client.reindex_rethrottle.assert_called_once_with(
+            task_id=testvars.generic_task['task'], requests_per_second=500)
+        self.assertEqual(500, ro.requests_per_second)
+        self.assertEqual(
+            500,
+            ro._get_reindex_args(testvars.named_index, 'other_index')['requests_per_second']
+        )
+    def test_reindex_with_rps_callback_task_finished(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
+        client.tasks.get.side_effect = fake_tasks_get()
+        # The task completes between the status check and the rethrottle
+        client.reindex_rethrottle.side_effect = NotFoundError(
+            'resource_not_found_exception', Mock(status=404), {})
+        ilo = IndexList(client)
+        ro = Reindex(ilo, testvars.reindex_basic, wait_interval=1, rps_callback=lambda x: 500)
+        self.assertIsNone(ro.do_action())
+        client.reindex_rethrottle.assert_called_once()
+        self.assertEqual(-1, ro.requests_per_second)
+    @patch('curator.actions.reindex.Builder')
+    def test_remote_client_reused(self, mock_builder):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_one
+        client.cluster.state.return_value = testvars.clu_state_one
+        client.indices.stats.return_value = testvars.stats_one
+        ilo = IndexList(client)
+        mock_builder.return_value.client = client
+        _REMOTE_CLIENT_CACHE.clear()
+        # The same remote, written two different ways
+        for host in ['https://example.org:9200', 'https://example.org:9200/']:
+            body = {
+                'source': {
+                    'index': 'REINDEX_SELECTION',
+                    'remote': {'host': host}
+                },
+                'dest': { 'index': 'other_index' }
+            }
+            ro = Reindex(ilo, body)
+            self.assertEqual((testvars.named_index,), ro.body['source']['index'])
+        _REMOTE_CLIENT_CACHE.clear()
+        mock_builder.assert_called_once()
+    def test_remote_host_and_port(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_one
+        client.cluster.state.return_value = testvars.clu_state_one
+        client.indices.stats.return_value = testvars.stats_one
+        ilo = IndexList(client)
+        body = {
+            'source': {
+                'index': 'irrelevant',
+                'remote': {'host': 'https://example.org:9201'}
+            },
+            'dest': { 'index': 'other_index' }
+        }
+        ro = Reindex(ilo, body)
+        self.assertEqual('example.org', ro.remote_host)
+        self.assertEqual('9201', ro.remote_port)
+    def test_reindex_with_wait_dest_missing(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.reindex.return_value = testvars.generic_task
+        # No response in the task data, so the dest is checked
+        client.options.return_value = client
+        client.tasks.get.return_value = {
+            'completed': True, 'task': testvars.completed_task['task'],
+            'error': {'type': 'unit_test'}
+        }
+        client.indices.resolve_index.return_value = {
+            'indices': [], 'aliases': [], 'data_streams': []}
+        ilo = IndexList(client)
+        ro = Reindex(ilo, testvars.reindex_basic)
+        self.assertRaises(FailedExecution, ro.do_action)
+    def test_reindex_with_wait_dest_data_stream(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.reindex.return_value = testvars.generic_task
+        # No response in the task data, so the dest is checked
+        client.options.return_value = client
+        client.tasks.get.return_value = {
+            'completed': True, 'task': testvars.completed_task['task'],
+            'error': {'type': 'unit_test'}
+        }
+        client.indices.resolve_index.return_value = {
+            'indices': [], 'aliases': [], 'data_streams': [{'name': 'other_index'}]}
+        ilo = IndexList(client)
+        ro = Reindex(ilo, testvars.reindex_basic)
+        self.assertIsNone(ro.do_action())
+    def test_migration_sources(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        ilo = IndexList(client)
+        body = {'source': {'index': 'REINDEX_SELECTION'}, 'dest': {'index': 'MIGRATION'}}
+        ro = Reindex(ilo, body, migration_prefix='new-', migration_suffix='-v2')
+        self.assertEqual(
+            [(idx, f'new-{idx}-v2') for idx in ilo.indices], list(ro.sources()))
+    def test_migration_cap_slices_per_source(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        ilo = IndexList(client)
+        first, second = sorted(ilo.indices)
+        client.indices.get_settings.return_value = {
+            first: {'settings': {'index': {'number_of_shards': '2'}}},
+            second: {'settings': {'index': {'number_of_shards': '4'}}},
+        }
+        body = {'source': {'index': 'REINDEX_SELECTION'}, 'dest': {'index': 'MIGRATION'}}
+        ro = Reindex(ilo, body, slices=10, migration_prefix='new-')
+        self.assertEqual(4, ro.slices)
+        slices = {
+            source: ro._get_reindex_args(source, dest)['slices'] for source, dest in ro.sources()}
+        self.assertEqual({first: 2, second: 4}, slices)
+    def test_get_processed_items_running_task(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        # A running task has no response yet
+        client.tasks.get.return_value = {
+            'completed': False, 'task': testvars.incomplete_task['task']}
+        ilo = IndexList(client)
+        ro = Reindex(ilo, testvars.reindex_basic)
+        self.assertEqual(-1, ro.get_processed_items('node:1'))
+        client.tasks.get.assert_called_once_with(task_id='node:1')
+    def test_reindex_with_wait_skips_dest_check(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
+        client.tasks.get.return_value = testvars.completed_task
+        ilo = IndexList(client)
+        ro = Reindex(ilo, testvars.reindex_basic)
+        self.assertIsNone(ro.do_action())
+        client.indices.resolve_index.assert_not_called()
+    def test_reindex_with_wait_noops_checks_dest(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_four
+        client.cluster.state.return_value = testvars.clu_state_four
+        client.indices.stats.return_value = testvars.stats_four
+        client.reindex.return_value = testvars.generic_task
+        client.options.return_value = client
+        noop_response = {'created': 0, 'updated': 0, 'noops': 100, 'total': 100, 'failures': []}
+        client.tasks.get.return_value = {
+            'completed': True, 'task': testvars.completed_task['task'], 'response': noop_response}
+        client.indices.resolve_index.return_value = {
+            'indices': [{'name': 'other_index'}], 'aliases': [], 'data_streams': []}
+        ilo = IndexList(client)
+        ro = Reindex(ilo, testvars.reindex_basic)
+        self.assertIsNone(ro.do_action())
+        client.indices.resolve_index.assert_called_once_with(name='other_index')
+    def test_migration_concurrent_tasks(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.reindex.side_effect = [{'task': 'node:1'}, {'task': 'node:2'}]
+        client.options.return_value = client
+        client.tasks.get.return_value = testvars.completed_task
+        ilo = IndexList(client)
+        body = {'source': {'index': 'REINDEX_SELECTION'}, 'dest': {'index': 'MIGRATION'}}
+        ro = Reindex(ilo, body, migration_prefix='new-', max_concurrent_tasks=2)
+        self.assertIsNone(ro.do_action())
+        # Both tasks are submitted before waiting on either of them
+        calls = [name for name, _, _ in client.mock_calls if name in ('reindex', 'tasks.get')]
+        self.assertEqual(['reindex', 'reindex', 'tasks.get'], calls[:3])
+    def test_migration_concurrent_tasks_rethrottle_all(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.reindex.side_effect = [{'task': 'node:1'}, {'task': 'node:2'}]
+        client.options.return_value = client
+        client.tasks.get.side_effect = fake_tasks_get()
+        ilo = IndexList(client)
+        body = {'source': {'index': 'REINDEX_SELECTION'}, 'dest': {'index': 'MIGRATION'}}
+        ro = Reindex(
+            ilo, body, migration_prefix='new-', wait_interval=1, max_concurrent_tasks=2,
+            rps_callback=lambda x: 500
+        )
+        self.assertIsNone(ro.do_action())
+        # Waiting on node:1 rethrottles node:2 as well, so no second rethrottle is needed
+        self.assertEqual(
+            [
+                call(task_id='node:1', requests_per_second=500),
+                call(task_id='node:2', requests_per_second=500),
+            ],
+            client.reindex_rethrottle.call_args_list
+        )
+    def test_migration_concurrent_tasks_rethrottle_finished(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.reindex.side_effect = [{'task': 'node:1'}, {'task': 'node:2'}]
+        client.options.return_value = client
+        client.tasks.get.side_effect = fake_tasks_get()
+        # node:2 has already finished by the time node:1 is rethrottled
+        client.reindex_rethrottle.side_effect = [
+            None, NotFoundError('resource_not_found_exception', Mock(status=404), {})]
+        ilo = IndexList(client)
+        body = {'source': {'index': 'REINDEX_SELECTION'}, 'dest': {'index': 'MIGRATION'}}
+        ro = Reindex(
+            ilo, body, migration_prefix='new-', wait_interval=1, max_concurrent_tasks=2,
+            rps_callback=lambda x: 500
+        )
+        self.assertIsNone(ro.do_action())
+        self.assertEqual(2, client.reindex_rethrottle.call_count)
+        self.assertEqual(500, ro.requests_per_second)
+        # node:2 was still waited on
+        self.assertEqual('node:2', ro.task_id)
+    def test_migration_concurrent_tasks_too_many_requests(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '5.0.0'} }
+        client.indices.get_settings.return_value = testvars.settings_two
+        client.cluster.state.return_value = testvars.clu_state_two
+        client.indices.stats.return_value = testvars.stats_two
+        client.reindex.side_effect = [
+            {'task': 'node:1'}, ApiError('Too Many Requests', Mock(status=429), {}),
+            {'task': 'node:2'}
+        ]
+        client.options.return_value = client
+        client.tasks.get.return_value = testvars.completed_task
+        ilo = IndexList(client)
+        body = {'source': {'index': 'REINDEX_SELECTION'}, 'dest': {'index': 'MIGRATION'}}
+        ro = Reindex(ilo, body, migration_prefix='new-', max_concurrent_tasks=2)
+        self.assertIsNone(ro.do_action())
+        self.assertEqual(1, ro.max_concurrent_tasks)
+        self.assertEqual(3, client.reindex.call_count)
@@ -2,9 +2,11 @@
 from unittest import TestCase
 import pytest
 from mock import Mock
+from elasticsearch8 import ApiError
+from elasticsearch8.exceptions import ConnectionTimeout
 from curator.exceptions import ActionTimeout, ConfigurationError, CuratorException, MissingArgument
 from curator.helpers.waiters import (
-    health_check, restore_check, snapshot_check,task_check, wait_for_it)
+    WAIT_MARGIN, health_check, restore_check, snapshot_check,task_check, wait_for_it)
 
 FAKE_FAIL = Exception('Simulated Failure')
 
@@ -194,6 +196,39 @@ class TestTaskCheck(TestCase):
         test_task = {'completed': True, 'task': self.PROTO_TASK, 'response': {'failures': []}}
         client.tasks.get.return_value = test_task
         assert task_check(client, task_id=self.GENERIC_TASK['task'])
+    def test_wait_timeout(self):
+        """test_wait_timeout
+
+        Should ask Elasticsearch to wait for completion if ``wait_timeout`` is set, and give the
+        client enough time for that
+        """
+        client = Mock()
+        client.options.return_value = client
+        test_task = {'completed': True, 'task': self.PROTO_TASK, 'response': {'failures': []}}
+        client.tasks.get.return_value = test_task
+        assert task_check(client, task_id=self.GENERIC_TASK['task'], wait_timeout=9)
+        client.options.assert_called_with(request_timeout=9 + WAIT_MARGIN)
+        client.tasks.get.assert_called_with(
+            task_id=self.GENERIC_TASK['task'], wait_for_completion=True, timeout='9s')
+    def test_wait_timeout_reached(self):
+        """test_wait_timeout_reached
+
+        Should return ``False`` if Elasticsearch times out waiting for the task to complete
+        """
+        client = Mock()
+        client.options.return_value = client
+        client.tasks.get.side_effect = ApiError('timeout_exception', Mock(status=408), {})
+        assert not task_check(client, task_id=self.GENERIC_TASK['task'], wait_timeout=9)
+    def test_wait_connection_timeout(self):
+        """test_wait_connection_timeout
+
+        Should raise ``CuratorException`` if the client itself times out
+        """
+        client = Mock()
+        client.options.return_value = client
+        client.tasks.get.side_effect = ConnectionTimeout('Simulated timeout')
+        with pytest.raises(CuratorException, match=r'Unable to obtain task information for task'):
+            task_check(client, task_id=self.GENERIC_TASK['task'], wait_timeout=9)
 
 class TestWaitForIt(TestCase):
     """TestWaitForIt
@@ -2,7 +2,7 @@
 from unittest import TestCase
 from voluptuous import Schema
 from curator.exceptions import ConfigurationError
-from curator.validators import SchemaCheck
+from curator.validators import SchemaCheck, options
 from curator.validators.filter_functions import validfilters, singlefilter
 
 
@@ -232,3 +232,23 @@ class TestFilterTypes(TestCase):
             }
         ]
         self.assertEqual(config, shared_result(config, action))
+
+class TestSchemaCheck(TestCase):
+    def test_badvalue(self):
+        schema = SchemaCheck({'key': 'notanint'}, Schema({'key': int}), 'test', 'testing')
+        self.assertRaises(ConfigurationError, schema.result)
+        self.assertEqual('notanint', schema.badvalue)
+
+class TestReindexOptions(TestCase):
+    BODY = {'source': {'index': 'index1'}, 'dest': {'index': 'index2'}}
+    def reindex_options(self, config):
+        return SchemaCheck(config, options.get_schema('reindex'), 'options', 'testing').result()
+    def test_slices_default_auto(self):
+        result = self.reindex_options({'request_body': self.BODY})
+        self.assertEqual('auto', result['slices'])
+    def test_slices_int(self):
+        result = self.reindex_options({'request_body': self.BODY, 'slices': '3'})
+        self.assertEqual(3, result['slices'])
+    def test_slices_invalid(self):
+        self.assertRaises(
+            ConfigurationError, self.reindex_options, {'request_body': self.BODY, 'slices': 'many'})